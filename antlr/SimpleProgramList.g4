@@ -0,0 +1,30 @@
+grammar SimpleProgramList;
+
+start : statement
+      ;
+
+statement : Identifier ':=' expr        # assignmentStatement
+          | 'begin' stmt_list 'end'     # blockStatement
+          | 'if' expr 'then' statement  # ifStatement
+          | 'while' expr 'do' statement # whileStatement
+          ;
+
+expr : expr op=('+' | '-' | '>') term  # binaryExpr
+     | term                      # unaryExpr
+     ;
+
+term : Number
+     | Identifier
+     ;
+
+stmt_list : statement (';' statement)*
+          ;
+
+Number : Digit+
+       ;
+
+Identifier : [a-zA-Z_] [a-zA-Z_0-9]*
+           ;
+
+Digit : ('0'..'9') ;
+WS : [ \t\r\n]+ -> skip ;
@@ -0,0 +1,93 @@
+# Generated from SimpleProgramList.g4 by ANTLR 4.10.1
+from antlr4 import *
+if __name__ is not None and "." in __name__:
+    from .SimpleProgramListParser import SimpleProgramListParser
+else:
+    from SimpleProgramListParser import SimpleProgramListParser
+
+# This class defines a complete listener for a parse tree produced by SimpleProgramListParser.
+class SimpleProgramListListener(ParseTreeListener):
+
+    # Enter a parse tree produced by SimpleProgramListParser#start.
+    def enterStart(self, ctx:SimpleProgramListParser.StartContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#start.
+    def exitStart(self, ctx:SimpleProgramListParser.StartContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#assignmentStatement.
+    def enterAssignmentStatement(self, ctx:SimpleProgramListParser.AssignmentStatementContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#assignmentStatement.
+    def exitAssignmentStatement(self, ctx:SimpleProgramListParser.AssignmentStatementContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#blockStatement.
+    def enterBlockStatement(self, ctx:SimpleProgramListParser.BlockStatementContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#blockStatement.
+    def exitBlockStatement(self, ctx:SimpleProgramListParser.BlockStatementContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#ifStatement.
+    def enterIfStatement(self, ctx:SimpleProgramListParser.IfStatementContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#ifStatement.
+    def exitIfStatement(self, ctx:SimpleProgramListParser.IfStatementContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#whileStatement.
+    def enterWhileStatement(self, ctx:SimpleProgramListParser.WhileStatementContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#whileStatement.
+    def exitWhileStatement(self, ctx:SimpleProgramListParser.WhileStatementContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#unaryExpr.
+    def enterUnaryExpr(self, ctx:SimpleProgramListParser.UnaryExprContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#unaryExpr.
+    def exitUnaryExpr(self, ctx:SimpleProgramListParser.UnaryExprContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#binaryExpr.
+    def enterBinaryExpr(self, ctx:SimpleProgramListParser.BinaryExprContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#binaryExpr.
+    def exitBinaryExpr(self, ctx:SimpleProgramListParser.BinaryExprContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#term.
+    def enterTerm(self, ctx:SimpleProgramListParser.TermContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#term.
+    def exitTerm(self, ctx:SimpleProgramListParser.TermContext):
+        pass
+
+
+    # Enter a parse tree produced by SimpleProgramListParser#stmt_list.
+    def enterStmt_list(self, ctx:SimpleProgramListParser.Stmt_listContext):
+        pass
+
+    # Exit a parse tree produced by SimpleProgramListParser#stmt_list.
+    def exitStmt_list(self, ctx:SimpleProgramListParser.Stmt_listContext):
+        pass
+
+
+
+del SimpleProgramListParser
\ No newline at end of file
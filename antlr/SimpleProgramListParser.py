@@ -0,0 +1,584 @@
+# Generated from SimpleProgramList.g4 by ANTLR 4.10.1
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,15,53,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,1,0,1,0,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,
+        1,30,8,1,1,2,1,2,1,2,1,2,1,2,1,2,5,2,38,8,2,10,2,12,2,41,9,2,1,3,
+        1,3,1,4,1,4,1,4,5,4,48,8,4,10,4,12,4,51,9,4,1,4,0,1,4,5,0,2,4,6,
+        8,0,2,1,0,8,10,1,0,12,13,52,0,10,1,0,0,0,2,29,1,0,0,0,4,31,1,0,0,
+        0,6,42,1,0,0,0,8,44,1,0,0,0,10,11,3,2,1,0,11,1,1,0,0,0,12,13,5,13,
+        0,0,13,14,5,1,0,0,14,30,3,4,2,0,15,16,5,2,0,0,16,17,3,8,4,0,17,18,
+        5,3,0,0,18,30,1,0,0,0,19,20,5,4,0,0,20,21,3,4,2,0,21,22,5,5,0,0,
+        22,23,3,2,1,0,23,30,1,0,0,0,24,25,5,6,0,0,25,26,3,4,2,0,26,27,5,
+        7,0,0,27,28,3,2,1,0,28,30,1,0,0,0,29,12,1,0,0,0,29,15,1,0,0,0,29,
+        19,1,0,0,0,29,24,1,0,0,0,30,3,1,0,0,0,31,32,6,2,-1,0,32,33,3,6,3,
+        0,33,39,1,0,0,0,34,35,10,2,0,0,35,36,7,0,0,0,36,38,3,6,3,0,37,34,
+        1,0,0,0,38,41,1,0,0,0,39,37,1,0,0,0,39,40,1,0,0,0,40,5,1,0,0,0,41,
+        39,1,0,0,0,42,43,7,1,0,0,43,7,1,0,0,0,44,49,3,2,1,0,45,46,5,11,0,
+        0,46,48,3,2,1,0,47,45,1,0,0,0,48,51,1,0,0,0,49,47,1,0,0,0,49,50,
+        1,0,0,0,50,9,1,0,0,0,51,49,1,0,0,0,3,29,39,49
+    ]
+
+class SimpleProgramListParser ( Parser ):
+
+    grammarFileName = "SimpleProgramList.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "':='", "'begin'", "'end'", "'if'", "'then'", 
+                     "'while'", "'do'", "'+'", "'-'", "'>'", "';'" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "Number", "Identifier", "Digit", "WS" ]
+
+    RULE_start = 0
+    RULE_statement = 1
+    RULE_expr = 2
+    RULE_term = 3
+    RULE_stmt_list = 4
+
+    ruleNames =  [ "start", "statement", "expr", "term", "stmt_list" ]
+
+    EOF = Token.EOF
+    T__0=1
+    T__1=2
+    T__2=3
+    T__3=4
+    T__4=5
+    T__5=6
+    T__6=7
+    T__7=8
+    T__8=9
+    T__9=10
+    T__10=11
+    Number=12
+    Identifier=13
+    Digit=14
+    WS=15
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.10.1")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class StartContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def statement(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.StatementContext,0)
+
+
+        def getRuleIndex(self):
+            return SimpleProgramListParser.RULE_start
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterStart" ):
+                listener.enterStart(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitStart" ):
+                listener.exitStart(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStart" ):
+                return visitor.visitStart(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def start(self):
+
+        localctx = SimpleProgramListParser.StartContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_start)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 10
+            self.statement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return SimpleProgramListParser.RULE_statement
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class WhileStatementContext(StatementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SimpleProgramListParser.StatementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.ExprContext,0)
+
+        def statement(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.StatementContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterWhileStatement" ):
+                listener.enterWhileStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitWhileStatement" ):
+                listener.exitWhileStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhileStatement" ):
+                return visitor.visitWhileStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BlockStatementContext(StatementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SimpleProgramListParser.StatementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def stmt_list(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.Stmt_listContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBlockStatement" ):
+                listener.enterBlockStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBlockStatement" ):
+                listener.exitBlockStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockStatement" ):
+                return visitor.visitBlockStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AssignmentStatementContext(StatementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SimpleProgramListParser.StatementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def Identifier(self):
+            return self.getToken(SimpleProgramListParser.Identifier, 0)
+        def expr(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.ExprContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAssignmentStatement" ):
+                listener.enterAssignmentStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAssignmentStatement" ):
+                listener.exitAssignmentStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignmentStatement" ):
+                return visitor.visitAssignmentStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IfStatementContext(StatementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SimpleProgramListParser.StatementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.ExprContext,0)
+
+        def statement(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.StatementContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIfStatement" ):
+                listener.enterIfStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIfStatement" ):
+                listener.exitIfStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfStatement" ):
+                return visitor.visitIfStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def statement(self):
+
+        localctx = SimpleProgramListParser.StatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_statement)
+        try:
+            self.state = 29
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [SimpleProgramListParser.Identifier]:
+                localctx = SimpleProgramListParser.AssignmentStatementContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 12
+                self.match(SimpleProgramListParser.Identifier)
+                self.state = 13
+                self.match(SimpleProgramListParser.T__0)
+                self.state = 14
+                self.expr(0)
+                pass
+            elif token in [SimpleProgramListParser.T__1]:
+                localctx = SimpleProgramListParser.BlockStatementContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 15
+                self.match(SimpleProgramListParser.T__1)
+                self.state = 16
+                self.stmt_list()
+                self.state = 17
+                self.match(SimpleProgramListParser.T__2)
+                pass
+            elif token in [SimpleProgramListParser.T__3]:
+                localctx = SimpleProgramListParser.IfStatementContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 19
+                self.match(SimpleProgramListParser.T__3)
+                self.state = 20
+                self.expr(0)
+                self.state = 21
+                self.match(SimpleProgramListParser.T__4)
+                self.state = 22
+                self.statement()
+                pass
+            elif token in [SimpleProgramListParser.T__5]:
+                localctx = SimpleProgramListParser.WhileStatementContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 24
+                self.match(SimpleProgramListParser.T__5)
+                self.state = 25
+                self.expr(0)
+                self.state = 26
+                self.match(SimpleProgramListParser.T__6)
+                self.state = 27
+                self.statement()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return SimpleProgramListParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class UnaryExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SimpleProgramListParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def term(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.TermContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUnaryExpr" ):
+                listener.enterUnaryExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitUnaryExpr" ):
+                listener.exitUnaryExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaryExpr" ):
+                return visitor.visitUnaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BinaryExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SimpleProgramListParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.ExprContext,0)
+
+        def term(self):
+            return self.getTypedRuleContext(SimpleProgramListParser.TermContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBinaryExpr" ):
+                listener.enterBinaryExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBinaryExpr" ):
+                listener.exitBinaryExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBinaryExpr" ):
+                return visitor.visitBinaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = SimpleProgramListParser.ExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 4
+        self.enterRecursionRule(localctx, 4, self.RULE_expr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx = SimpleProgramListParser.UnaryExprContext(self, localctx)
+            self._ctx = localctx
+            _prevctx = localctx
+
+            self.state = 32
+            self.term()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 39
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,1,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = SimpleProgramListParser.BinaryExprContext(self, SimpleProgramListParser.ExprContext(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                    self.state = 34
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 35
+                    localctx.op = self._input.LT(1)
+                    _la = self._input.LA(1)
+                    if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SimpleProgramListParser.T__7) | (1 << SimpleProgramListParser.T__8) | (1 << SimpleProgramListParser.T__9))) != 0)):
+                        localctx.op = self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 36
+                    self.term() 
+                self.state = 41
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,1,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class TermContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def Number(self):
+            return self.getToken(SimpleProgramListParser.Number, 0)
+
+        def Identifier(self):
+            return self.getToken(SimpleProgramListParser.Identifier, 0)
+
+        def getRuleIndex(self):
+            return SimpleProgramListParser.RULE_term
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTerm" ):
+                listener.enterTerm(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTerm" ):
+                listener.exitTerm(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTerm" ):
+                return visitor.visitTerm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def term(self):
+
+        localctx = SimpleProgramListParser.TermContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_term)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 42
+            _la = self._input.LA(1)
+            if not(_la==SimpleProgramListParser.Number or _la==SimpleProgramListParser.Identifier):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Stmt_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def statement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(SimpleProgramListParser.StatementContext)
+            else:
+                return self.getTypedRuleContext(SimpleProgramListParser.StatementContext,i)
+
+
+        def getRuleIndex(self):
+            return SimpleProgramListParser.RULE_stmt_list
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterStmt_list" ):
+                listener.enterStmt_list(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitStmt_list" ):
+                listener.exitStmt_list(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmt_list" ):
+                return visitor.visitStmt_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmt_list(self):
+
+        localctx = SimpleProgramListParser.Stmt_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_stmt_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 44
+            self.statement()
+            self.state = 49
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==SimpleProgramListParser.T__10:
+                self.state = 45
+                self.match(SimpleProgramListParser.T__10)
+                self.state = 46
+                self.statement()
+                self.state = 51
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[2] = self.expr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def expr_sempred(self, localctx:ExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 2)
+         
+
+
+
+
@@ -0,0 +1,58 @@
+# Generated from SimpleProgramList.g4 by ANTLR 4.10.1
+from antlr4 import *
+if __name__ is not None and "." in __name__:
+    from .SimpleProgramListParser import SimpleProgramListParser
+else:
+    from SimpleProgramListParser import SimpleProgramListParser
+
+# This class defines a complete generic visitor for a parse tree produced by SimpleProgramListParser.
+
+class SimpleProgramListVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by SimpleProgramListParser#start.
+    def visitStart(self, ctx:SimpleProgramListParser.StartContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#assignmentStatement.
+    def visitAssignmentStatement(self, ctx:SimpleProgramListParser.AssignmentStatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#blockStatement.
+    def visitBlockStatement(self, ctx:SimpleProgramListParser.BlockStatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#ifStatement.
+    def visitIfStatement(self, ctx:SimpleProgramListParser.IfStatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#whileStatement.
+    def visitWhileStatement(self, ctx:SimpleProgramListParser.WhileStatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#unaryExpr.
+    def visitUnaryExpr(self, ctx:SimpleProgramListParser.UnaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#binaryExpr.
+    def visitBinaryExpr(self, ctx:SimpleProgramListParser.BinaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#term.
+    def visitTerm(self, ctx:SimpleProgramListParser.TermContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SimpleProgramListParser#stmt_list.
+    def visitStmt_list(self, ctx:SimpleProgramListParser.Stmt_listContext):
+        return self.visitChildren(ctx)
+
+
+
+del SimpleProgramListParser
\ No newline at end of file